@@ -1,97 +1,71 @@
-"""CLI entrypoint for the LUNA Algorithm Testbench."""
+"""CLI entrypoint for the LUNA Algorithm Testbench.
+
+Dispatch peeks the command name from argv before any parser exists, so
+not-yet-implemented commands return immediately and argparse (plus the
+parser tree in :mod:`luna_tb.cli.parsers`) is only imported when a real
+command needs its arguments parsed.
+"""
 from __future__ import annotations
 
-import argparse
-import pathlib
-from luna_tb.config import ConfigError, load_config
+import sys
+
 from luna_tb.logging_setup import configure_logging
-from luna_tb.services.ingest import ingest_logs
-from luna_tb.services.label_import import import_labels_csv
-from luna_tb.services.registry_import import import_run_registry
-from luna_tb.storage.db import init_db
-
-
-def _default_migrations_dir() -> pathlib.Path:
-    return pathlib.Path(__file__).resolve().parents[1] / "storage" / "migrations"
-
-
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(prog="luna-testbench")
-    parser.add_argument("--config", help="Path to TOML/JSON config.")
-    parser.add_argument("--log-level", default="INFO", help="Logging level.")
-    parser.add_argument(
-        "--json-logs", action="store_true", help="Emit logs in JSON format."
-    )
-
-    subparsers = parser.add_subparsers(dest="command", required=True)
-
-    db_init = subparsers.add_parser("db-init", help="Initialize/upgrade SQLite DB")
-    db_init.add_argument("--db", required=True, help="Path to SQLite file.")
-    db_init.add_argument(
-        "--migrations-dir",
-        default=str(_default_migrations_dir()),
-        help="Path to migrations directory.",
-    )
-
-    registry = subparsers.add_parser("registry", help="Run registry import utilities")
-    registry_sub = registry.add_subparsers(dest="registry_command", required=True)
-    registry_import = registry_sub.add_parser("import", help="Import run registry sheet")
-    registry_import.add_argument("--db", required=True, help="Path to SQLite file.")
-    registry_import.add_argument("--file", required=True, help="Path to registry .xlsx/.csv file.")
-    registry_import.add_argument(
-        "--sheet",
-        default="test runs",
-        help="Sheet name for .xlsx import.",
-    )
-    registry_import.add_argument(
-        "--default-tz",
-        default="Europe/Berlin",
-        help="Timezone to apply to naive/serial timestamps.",
-    )
-
-    ingest = subparsers.add_parser("ingest", help="Ingest lab log CSV files")
-    ingest.add_argument("--db", required=True, help="Path to SQLite file.")
-    ingest.add_argument("--device-id", required=True, help="Device identifier.")
-    ingest.add_argument("--diaper-type", required=True, help="Diaper type.")
-    ingest.add_argument("--sensor-layout", required=True, help="Sensor layout.")
-    ingest.add_argument("--run-notes", help="Optional run notes.")
-    ingest.add_argument(
-        "--default-tz",
-        default="Europe/Berlin",
-        help="Timezone name to assume when logs lack timezone.",
-    )
-    ingest.add_argument("logs", nargs="+", help="CSV log file(s) to ingest.")
-
-    label = subparsers.add_parser("label", help="Label import utilities")
-    label_sub = label.add_subparsers(dest="label_command", required=True)
-    label_import = label_sub.add_parser("import", help="Import labels from CSV")
-    label_import.add_argument("--db", required=True, help="Path to SQLite file.")
-    label_import.add_argument("--file", required=True, help="Path to label CSV.")
-    label_import.add_argument("--run-id", type=int, help="Run id for all labels.")
-
-    for name in ["derive", "simulate", "run", "report", "ui"]:
-        subparsers.add_parser(name, help=f"(stub) {name} command")
-
-    return parser
+
+# Global options that consume the following token, so _peek_command can skip
+# their values when looking for the subcommand name.
+_VALUE_OPTIONS = {"--config", "--log-level"}
+
+_STUB_COMMANDS = ["derive", "simulate", "run", "report", "ui"]
+
+
+def _peek_command(argv: list[str]) -> str | None:
+    """Return the first token that looks like a subcommand name, if any."""
+    skip_next = False
+    for token in argv:
+        if skip_next:
+            skip_next = False
+            continue
+        if token in _VALUE_OPTIONS:
+            skip_next = True
+            continue
+        if token.startswith("-"):
+            continue
+        return token
+    return None
 
 
 def main(argv: list[str] | None = None) -> int:
-    parser = build_parser()
-    args = parser.parse_args(argv)
+    argv_list = sys.argv[1:] if argv is None else list(argv)
+
+    command = _peek_command(argv_list)
+    if command in _STUB_COMMANDS:
+        print(f"Command not implemented yet: {command}", file=sys.stderr)
+        return 2
+
+    from luna_tb.cli.parsers import build_parser
+
+    parser = build_parser(argv_list)
+    args = parser.parse_args(argv_list)
 
     configure_logging(level=args.log_level, json_format=args.json_logs)
 
     if args.config:
+        from luna_tb.config import ConfigError, load_config
+
         try:
             load_config(args.config)
         except ConfigError as exc:
             parser.error(str(exc))
 
     if args.command == "db-init":
+        from luna_tb.storage.db import init_db
+
         init_db(args.db, args.migrations_dir)
         return 0
 
     if args.command == "registry" and args.registry_command == "import":
+        from luna_tb.services.registry_import import import_run_registry
+
         import_run_registry(
             args.db,
             args.file,
@@ -101,6 +75,8 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args.command == "ingest":
+        from luna_tb.services.ingest import ingest_logs
+
         ingest_logs(
             args.db,
             args.logs,
@@ -113,6 +89,8 @@ def main(argv: list[str] | None = None) -> int:
         return 0
 
     if args.command == "label" and args.label_command == "import":
+        from luna_tb.services.label_import import import_labels_csv
+
         import_labels_csv(args.db, args.file, run_id=args.run_id)
         return 0
 
@@ -0,0 +1,137 @@
+"""Argument parser construction for the CLI.
+
+Kept separate from the dispatch in :mod:`luna_tb.cli.main` so that argparse
+is only imported once a command actually needs its arguments parsed.
+"""
+from __future__ import annotations
+
+import argparse
+import functools
+import pathlib
+
+from luna_tb.cli.main import _peek_command
+
+
+class _FastParser(argparse.ArgumentParser):
+    """ArgumentParser with a memoized help formatter.
+
+    Python 3.14 calls ``_get_formatter()`` twice per ``add_argument`` to probe
+    color support, re-reading several environment variables each time. Caching
+    the formatter per parser keeps parser construction cheap on validation-only
+    paths; help rendering is unaffected.
+    """
+
+    def _get_formatter(self) -> argparse.HelpFormatter:
+        formatter = getattr(self, "_cached_formatter", None)
+        # Formatters are stateful: once sections were added (usage/help
+        # rendering), the instance cannot be reused and a fresh one is built.
+        root = getattr(formatter, "_root_section", None)
+        if formatter is None or root is None or root.items:
+            formatter = super()._get_formatter()
+            self._cached_formatter = formatter
+        return formatter
+
+
+@functools.cache
+def _default_migrations_dir() -> pathlib.Path:
+    # resolve() stats the path; cache it so repeated parser builds pay once.
+    return pathlib.Path(__file__).resolve().parents[1] / "storage" / "migrations"
+
+
+def _add_db_init_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    db_init = subparsers.add_parser("db-init", help="Initialize/upgrade SQLite DB")
+    db_init.add_argument("--db", required=True, help="Path to SQLite file.")
+    db_init.add_argument(
+        "--migrations-dir",
+        default=str(_default_migrations_dir()),
+        help="Path to migrations directory.",
+    )
+    return db_init
+
+
+def _add_registry_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    registry = subparsers.add_parser("registry", help="Run registry import utilities")
+    registry_sub = registry.add_subparsers(dest="registry_command", required=True)
+    registry_import = registry_sub.add_parser("import", help="Import run registry sheet")
+    registry_import.add_argument("--db", required=True, help="Path to SQLite file.")
+    registry_import.add_argument("--file", required=True, help="Path to registry .xlsx/.csv file.")
+    registry_import.add_argument(
+        "--sheet",
+        default="test runs",
+        help="Sheet name for .xlsx import.",
+    )
+    registry_import.add_argument(
+        "--default-tz",
+        default="Europe/Berlin",
+        help="Timezone to apply to naive/serial timestamps.",
+    )
+    return registry
+
+
+def _add_ingest_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    ingest = subparsers.add_parser("ingest", help="Ingest lab log CSV files")
+    ingest.add_argument("--db", required=True, help="Path to SQLite file.")
+    ingest.add_argument("--device-id", required=True, help="Device identifier.")
+    ingest.add_argument("--diaper-type", required=True, help="Diaper type.")
+    ingest.add_argument("--sensor-layout", required=True, help="Sensor layout.")
+    ingest.add_argument("--run-notes", help="Optional run notes.")
+    ingest.add_argument(
+        "--default-tz",
+        default="Europe/Berlin",
+        help="Timezone name to assume when logs lack timezone.",
+    )
+    ingest.add_argument("logs", nargs="+", help="CSV log file(s) to ingest.")
+    return ingest
+
+
+def _add_label_parser(subparsers: argparse._SubParsersAction) -> argparse.ArgumentParser:
+    label = subparsers.add_parser("label", help="Label import utilities")
+    label_sub = label.add_subparsers(dest="label_command", required=True)
+    label_import = label_sub.add_parser("import", help="Import labels from CSV")
+    label_import.add_argument("--db", required=True, help="Path to SQLite file.")
+    label_import.add_argument("--file", required=True, help="Path to label CSV.")
+    label_import.add_argument("--run-id", type=int, help="Run id for all labels.")
+    return label
+
+
+_SUBCOMMAND_FACTORIES = {
+    "db-init": _add_db_init_parser,
+    "registry": _add_registry_parser,
+    "ingest": _add_ingest_parser,
+    "label": _add_label_parser,
+}
+
+
+def build_parser(argv: list[str] | None = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+
+    When ``argv`` is given, only the subparser for the command it names is
+    fully populated; the remaining commands are registered as empty stubs so
+    that single-command invocations do not pay for the whole command tree.
+    Without ``argv`` (or when no known command is found) the full parser is
+    built, which keeps ``--help`` output complete.
+    """
+    parser = _FastParser(prog="luna-testbench")
+    parser.add_argument("--config", help="Path to TOML/JSON config.")
+    parser.add_argument("--log-level", default="INFO", help="Logging level.")
+    parser.add_argument(
+        "--json-logs", action="store_true", help="Emit logs in JSON format."
+    )
+
+    subparsers = parser.add_subparsers(dest="command", required=True, parser_class=_FastParser)
+
+    selected = _peek_command(argv) if argv is not None else None
+    if selected in _SUBCOMMAND_FACTORIES:
+        for name, factory in _SUBCOMMAND_FACTORIES.items():
+            if name == selected:
+                factory(subparsers)
+            else:
+                subparsers.add_parser(name, add_help=False)
+    else:
+        for factory in _SUBCOMMAND_FACTORIES.values():
+            factory(subparsers)
+
+    # Not-yet-implemented commands (derive, simulate, ...) are answered in
+    # main() before any parser is built, so they are not registered here.
+
+    return parser
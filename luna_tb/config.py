@@ -1,11 +1,17 @@
 """Configuration loading utilities."""
 from __future__ import annotations
 
+import functools
 import json
 import pathlib
 import tomllib
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional 'fast' extra; stdlib json is the fallback.
+    orjson = None
+
 
 class ConfigError(RuntimeError):
     """Raised when configuration loading fails."""
@@ -14,17 +20,28 @@ class ConfigError(RuntimeError):
 def load_config(path: str | pathlib.Path) -> dict[str, Any]:
     """Load a configuration file (TOML or JSON).
 
-    This stays dependency-free to keep offline-first setups lightweight.
+    The core stays dependency-free to keep offline-first setups lightweight;
+    orjson is used for JSON only when installed. Results are cached per
+    (path, mtime), so repeated loads within one process re-parse only after
+    the file changes. Callers must not mutate the returned dict.
     """
     path_obj = pathlib.Path(path)
     if not path_obj.exists():
         raise ConfigError(f"Config path does not exist: {path_obj}")
 
+    return _load_cached(str(path_obj), path_obj.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cached(path_str: str, mtime_ns: int) -> dict[str, Any]:
+    path_obj = pathlib.Path(path_str)
     suffix = path_obj.suffix.lower()
     if suffix == ".toml":
         with path_obj.open("rb") as handle:
             return tomllib.load(handle)
     if suffix == ".json":
+        if orjson is not None:
+            return orjson.loads(path_obj.read_bytes())
         with path_obj.open("r", encoding="utf-8") as handle:
             return json.load(handle)
 
@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunMetadata:
     device_id: str
     diaper_type: str
@@ -18,7 +18,7 @@ class RunMetadata:
     sampling_interval_s: Optional[float] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReadingSample:
     t_elapsed_s: float
     temp_c: Optional[float]
@@ -27,7 +27,7 @@ class ReadingSample:
     sensor_id: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LabelEvent:
     event_type: str
     event_time_s: float
@@ -42,7 +42,7 @@ class LabelEvent:
     notes: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RunRegistryEntry:
     external_run_id: str
     source_file: str
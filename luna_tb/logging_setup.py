@@ -1,10 +1,16 @@
 """Logging setup for the testbench."""
 from __future__ import annotations
 
+import json
 import logging
 import sys
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # Optional 'fast' extra; stdlib json is the fallback.
+    orjson = None
+
 
 def configure_logging(level: str = "INFO", json_format: bool = False) -> None:
     """Configure root logging with a deterministic format."""
@@ -28,6 +34,18 @@ def configure_logging(level: str = "INFO", json_format: bool = False) -> None:
 class _JsonFormatter(logging.Formatter):
     """Minimal JSON log formatter (stdlib only)."""
 
+    _last_sec: int | None = None
+    _last_str: str = ""
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        # Consecutive records within the same second format identically;
+        # a single-slot cache skips the localtime/strftime pair for them.
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_str = super().formatTime(record, datefmt)
+            self._last_sec = sec
+        return self._last_str
+
     def format(self, record: logging.LogRecord) -> str:
         payload: dict[str, Any] = {
             "ts": self.formatTime(record, datefmt="%Y-%m-%dT%H:%M:%S"),
@@ -39,6 +57,8 @@ class _JsonFormatter(logging.Formatter):
 
 
 def _json_dumps(payload: dict[str, Any]) -> str:
-    import json
-
-    return json.dumps(payload, sort_keys=True)
+    # The payload dict is built in a fixed key order, so no sort is needed
+    # to keep the output deterministic.
+    if orjson is not None:
+        return orjson.dumps(payload).decode()
+    return json.dumps(payload)
@@ -0,0 +1,19 @@
+"""Optional fast-path dependencies for the services.
+
+The core pipeline stays stdlib-only (offline-first); pandas merely provides
+vectorized parsing fast paths with identical results. Install the 'fast'
+extra to enable them.
+"""
+from __future__ import annotations
+
+import functools
+
+
+@functools.lru_cache(maxsize=None)
+def _pandas():
+    """Return pandas if the optional 'fast' extra is installed, else None."""
+    try:
+        import pandas
+    except ImportError:
+        return None
+    return pandas
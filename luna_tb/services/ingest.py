@@ -3,30 +3,58 @@ from __future__ import annotations
 
 import csv
 import datetime as dt
+import functools
 import logging
 import pathlib
 import re
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
 from luna_tb.domain.models import ReadingSample, RunMetadata
+from luna_tb.services._optional import _pandas
 from luna_tb.storage.db import get_connection
 from luna_tb.storage.repositories import ReadingRepository, RunRegistryRepository, RunRepository
 
 LOGGER = logging.getLogger(__name__)
-_TEMP_HUMID_PATTERN = re.compile(
-    r"temp_humid_sample:\s*"
-    r"(\d{4})-(\d{1,2})-(\d{1,2})\s+"
-    r"(\d{1,2}):(\d{1,2}):(\d{1,2}),\s*"
-    r"temp:\s*([0-9.]+),\s*humid:\s*([0-9.]+)%",
-)
-_TZ_PAREN_PATTERN = re.compile(r"tz\(([+-]?\d+)\)")
-_TZ_CCLK_PATTERN = re.compile(r'\+CCLK:\s*"\d{2}/\d{2}/\d{2},\d{2}:\d{2}:\d{2}([+-]\d{2})"')
+
+_PATTERNS = {
+    "temp_humid": (
+        r"temp_humid_sample:\s*"
+        r"(\d{4})-(\d{1,2})-(\d{1,2})\s+"
+        r"(\d{1,2}):(\d{1,2}):(\d{1,2}),\s*"
+        r"temp:\s*([0-9.]+),\s*humid:\s*([0-9.]+)%"
+    ),
+    # Either timezone marker shape; one search finds whichever occurs first
+    # in the log, matching the line-order scan this replaced.
+    "tz_marker": (
+        r"tz\(([+-]?\d+)\)"
+        r'|\+CCLK:\s*"\d{2}/\d{2}/\d{2},\d{2}:\d{2}:\d{2}([+-]\d{2})"'
+    ),
+    # Whole-second naive ISO timestamp; the common case for lab CSV exports.
+    "naive_iso": r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:[0-5]\d$",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _regex(name: str) -> re.Pattern[str]:
+    """Compile a named pattern on first use so non-ingest commands skip it."""
+    return re.compile(_PATTERNS[name])
 
 
 class IngestError(RuntimeError):
     """Raised when ingestion fails."""
 
 
+# Columns the stdlib path treats as text: read them as strings on the pandas
+# path too, so cells keep their exact CSV text (a numeric sensor_id stays
+# '3', a bad timestamp fails with the raw value) instead of being inferred
+# into numbers and diverging. pandas ignores dtype entries for columns a
+# file does not have.
+_TEXT_DTYPES = {
+    "timestamp": str,
+    "sensor_id": str,
+}
+
+
 def ingest_logs(
     db_path: str | pathlib.Path,
     log_paths: Iterable[str | pathlib.Path],
@@ -39,14 +67,17 @@ def ingest_logs(
 ) -> list[int]:
     """Ingest one or more log files and return created run IDs."""
     run_ids: list[int] = []
+    path_objs = [pathlib.Path(log_path) for log_path in log_paths]
     with get_connection(db_path) as conn:
         run_repo = RunRepository(conn)
         reading_repo = ReadingRepository(conn)
+        registry_repo = RunRegistryRepository(conn)
+        registry_entries = registry_repo.find_many_by_log_file_ref(
+            [path_obj.name for path_obj in path_objs]
+        )
 
-        for log_path in log_paths:
-            path_obj = pathlib.Path(log_path)
-            registry_repo = RunRegistryRepository(conn)
-            registry_entry = registry_repo.find_by_log_file_ref(path_obj.name)
+        for path_obj in path_objs:
+            registry_entry = registry_entries.get(path_obj.name)
             if registry_entry is None:
                 raise IngestError(
                     "No run_registry entry matches log file "
@@ -58,14 +89,6 @@ def ingest_logs(
                     f"{registry_entry['run_id']}"
                 )
 
-            readings = _parse_log_file(path_obj, default_tz=default_tz)
-            if not readings:
-                raise IngestError(f"No readings parsed from {path_obj}")
-
-            start_ts = readings[0].timestamp
-            end_ts = readings[-1].timestamp
-            sampling_interval_s = _estimate_sampling_interval(readings)
-
             metadata = RunMetadata(
                 device_id=device_id,
                 diaper_type=diaper_type,
@@ -73,21 +96,88 @@ def ingest_logs(
                 external_run_id=registry_entry["external_run_id"],
                 file_name=path_obj.name,
                 notes=run_notes,
-                start_ts=start_ts,
-                end_ts=end_ts,
-                sampling_interval_s=sampling_interval_s,
             )
             run_id = run_repo.create_run(metadata)
-            reading_repo.insert_readings(run_id, readings)
-            registry_repo.attach_run(registry_entry["registry_id"], run_id)
-            conn.commit()
+
+            stats = _ReadingStats()
+            reading_repo.insert_readings(
+                run_id, stats.observe(_parse_log_file(path_obj, default_tz=default_tz))
+            )
+            if stats.count == 0:
+                raise IngestError(f"No readings parsed from {path_obj}")
+
+            run_repo.update_run_window(
+                run_id,
+                start_ts=stats.start_ts,
+                end_ts=stats.end_ts,
+                sampling_interval_s=stats.sampling_interval_s(),
+            )
+            # The prefetched guard above only sees links that existed before
+            # the batch; the UPDATE refuses already-linked rows, so a log file
+            # listed twice in one batch fails here instead of double-linking.
+            if registry_repo.attach_by_log_file(run_id, path_obj.name) is None:
+                raise IngestError(
+                    f"run_registry entry for '{path_obj.name}' is already linked "
+                    "to another run (log file listed twice in this batch?)"
+                )
             run_ids.append(run_id)
-            LOGGER.info("Ingested %s as run_id=%s (%s readings)", path_obj, run_id, len(readings))
+            LOGGER.info("Ingested %s as run_id=%s (%s readings)", path_obj, run_id, stats.count)
+
+        # One commit (fsync) for the whole batch; a failure anywhere rolls
+        # back every file via the connection context manager.
+        conn.commit()
 
     return run_ids
 
 
-def _parse_log_file(path: pathlib.Path, *, default_tz: str) -> list[ReadingSample]:
+class _ReadingStats:
+    """Running aggregates over a reading stream (single pass, O(1) memory)."""
+
+    __slots__ = (
+        "count",
+        "start_ts",
+        "end_ts",
+        "_min_t",
+        "_max_t",
+        "_last_t",
+        "_delta_sum",
+        "_delta_count",
+    )
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.start_ts: Optional[str] = None
+        self.end_ts: Optional[str] = None
+        self._min_t: Optional[float] = None
+        self._max_t: Optional[float] = None
+        self._last_t: Optional[float] = None
+        self._delta_sum = 0.0
+        self._delta_count = 0
+
+    def observe(self, readings: Iterable[ReadingSample]) -> Iterator[ReadingSample]:
+        """Yield samples unchanged while tracking window and interval stats."""
+        for sample in readings:
+            t = sample.t_elapsed_s
+            if self._min_t is None or t < self._min_t:
+                self._min_t = t
+                self.start_ts = sample.timestamp
+            if self._max_t is None or t >= self._max_t:
+                self._max_t = t
+                self.end_ts = sample.timestamp
+            if self._last_t is not None and t >= self._last_t:
+                self._delta_sum += t - self._last_t
+                self._delta_count += 1
+            self._last_t = t
+            self.count += 1
+            yield sample
+
+    def sampling_interval_s(self) -> Optional[float]:
+        if self._delta_count == 0:
+            return None
+        return self._delta_sum / self._delta_count
+
+
+def _parse_log_file(path: pathlib.Path, *, default_tz: str) -> Iterable[ReadingSample]:
     suffix = path.suffix.lower()
     if suffix == ".csv":
         return _parse_csv_log(path, default_tz=default_tz)
@@ -96,57 +186,139 @@ def _parse_log_file(path: pathlib.Path, *, default_tz: str) -> list[ReadingSampl
     raise IngestError(f"Unsupported log format: {path.suffix}")
 
 
-def _parse_csv_log(path: pathlib.Path, *, default_tz: str) -> list[ReadingSample]:
+def _parse_csv_log(path: pathlib.Path, *, default_tz: str) -> Iterable[ReadingSample]:
     if not path.exists():
         raise IngestError(f"Log path does not exist: {path}")
 
+    pd = _pandas()
+    if pd is not None:
+        return _parse_csv_log_vectorized(path, default_tz=default_tz, pd=pd)
+    return _parse_csv_log_stdlib(path, default_tz=default_tz)
+
+
+def _parse_csv_log_vectorized(path: pathlib.Path, *, default_tz: str, pd) -> list[ReadingSample]:
+    """Parse a CSV log with pandas.
+
+    Samples are returned in file order — the same order the stdlib parser
+    yields — so stored rows and the arrival-order sampling-interval estimate
+    are identical whichever parser runs.
+    """
+    df = pd.read_csv(path, dtype=_TEXT_DTYPES)
+    df.columns = [str(name).strip() for name in df.columns]
+
+    required = {"t_elapsed_s", "temp_c", "rh_pct"}
+    missing = required.difference(df.columns)
+    if missing:
+        raise IngestError(f"Missing required columns {sorted(missing)} in {path}")
+
+    def _numeric(field: str, *, allow_empty: bool) -> list[Optional[float]]:
+        values = pd.to_numeric(df[field], errors="coerce")
+        invalid = values.isna() & df[field].notna()
+        if invalid.any():
+            bad = df[field][invalid].iloc[0]
+            raise IngestError(f"Invalid {field} value '{bad}' in {path}")
+        if not allow_empty and values.isna().any():
+            raise IngestError(f"Missing {field} value in {path}")
+        return [None if pd.isna(value) else float(value) for value in values]
+
+    t_elapsed = _numeric("t_elapsed_s", allow_empty=False)
+    temp_c = _numeric("temp_c", allow_empty=True)
+    rh_pct = _numeric("rh_pct", allow_empty=True)
+
+    if "timestamp" in df.columns:
+        # Cells arrive as their exact CSV text (dtype=str above), so invalid
+        # timestamps fail the ingest with the raw value just like the stdlib
+        # path; only truly missing cells (NaN) become None.
+        timestamps = [
+            _normalize_timestamp(
+                _empty_to_none(value) if isinstance(value, str) else None,
+                default_tz=default_tz,
+                path=path,
+            )
+            for value in df["timestamp"]
+        ]
+    else:
+        timestamps = [None] * len(df)
+
+    if "sensor_id" in df.columns:
+        sensor_ids = [
+            _empty_to_none(value) if isinstance(value, str) else None
+            for value in df["sensor_id"]
+        ]
+    else:
+        sensor_ids = [None] * len(df)
+
+    return [
+        ReadingSample(
+            t_elapsed_s=t,
+            temp_c=temp,
+            rh_pct=rh,
+            timestamp=timestamp,
+            sensor_id=sensor_id,
+        )
+        for t, temp, rh, timestamp, sensor_id in zip(
+            t_elapsed, temp_c, rh_pct, timestamps, sensor_ids
+        )
+    ]
+
+
+def _parse_csv_log_stdlib(path: pathlib.Path, *, default_tz: str) -> Iterator[ReadingSample]:
+    """Parse a CSV log row by row with the csv module.
+
+    Samples are yielded in file order; ingest stores them in that order and
+    derives the sampling interval from non-negative arrival-order deltas.
+    """
     with path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        if reader.fieldnames is None:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
             raise IngestError(f"Missing header row in {path}")
 
+        indices = {name.strip(): i for i, name in enumerate(header)}
         required = {"t_elapsed_s", "temp_c", "rh_pct"}
-        missing = required.difference({name.strip() for name in reader.fieldnames})
+        missing = required.difference(indices)
         if missing:
             raise IngestError(f"Missing required columns {sorted(missing)} in {path}")
 
-        readings: list[ReadingSample] = []
+        t_idx = indices["t_elapsed_s"]
+        temp_idx = indices["temp_c"]
+        rh_idx = indices["rh_pct"]
+        ts_idx = indices.get("timestamp")
+        sensor_idx = indices.get("sensor_id")
+
         for row in reader:
+            if not row:
+                continue
             timestamp = _normalize_timestamp(
-                _empty_to_none(row.get("timestamp")),
+                _empty_to_none(_cell(row, ts_idx)),
                 default_tz=default_tz,
                 path=path,
             )
-            readings.append(
-                ReadingSample(
-                    t_elapsed_s=_to_float(row.get("t_elapsed_s"), "t_elapsed_s", path),
-                    temp_c=_to_float(row.get("temp_c"), "temp_c", path, allow_empty=True),
-                    rh_pct=_to_float(row.get("rh_pct"), "rh_pct", path, allow_empty=True),
-                    timestamp=timestamp,
-                    sensor_id=_empty_to_none(row.get("sensor_id")),
-                )
+            yield ReadingSample(
+                t_elapsed_s=_to_float(_cell(row, t_idx), "t_elapsed_s", path),
+                temp_c=_to_float(_cell(row, temp_idx), "temp_c", path, allow_empty=True),
+                rh_pct=_to_float(_cell(row, rh_idx), "rh_pct", path, allow_empty=True),
+                timestamp=timestamp,
+                sensor_id=_empty_to_none(_cell(row, sensor_idx)),
             )
 
-    readings.sort(key=lambda sample: sample.t_elapsed_s)
-    return readings
+
+def _cell(row: list[str], index: Optional[int]) -> Optional[str]:
+    if index is None or index >= len(row):
+        return None
+    return row[index]
 
 
-def _parse_device_log(path: pathlib.Path, *, default_tz: str) -> list[ReadingSample]:
+def _parse_device_log(path: pathlib.Path, *, default_tz: str) -> Iterator[ReadingSample]:
     if not path.exists():
         raise IngestError(f"Log path does not exist: {path}")
 
-    lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-    tzinfo = _detect_tzinfo(lines, default_tz=default_tz)
+    text = path.read_text(encoding="utf-8", errors="ignore")
+    tzinfo = _detect_tzinfo(text, default_tz=default_tz)
 
-    readings: list[ReadingSample] = []
     base_dt: Optional[dt.datetime] = None
 
-    for line in lines:
-        match = _TEMP_HUMID_PATTERN.search(line)
-        if not match:
-            continue
-
-        year, month, day, hour, minute, second, temp, humid = match.groups()
+    for year, month, day, hour, minute, second, temp, humid in _regex("temp_humid").findall(text):
         sample_dt = dt.datetime(
             int(year),
             int(month),
@@ -159,33 +331,14 @@ def _parse_device_log(path: pathlib.Path, *, default_tz: str) -> list[ReadingSam
         if base_dt is None:
             base_dt = sample_dt
 
-        readings.append(
-            ReadingSample(
-                t_elapsed_s=(sample_dt - base_dt).total_seconds(),
-                temp_c=float(temp),
-                rh_pct=float(humid),
-                timestamp=sample_dt.isoformat(),
-                sensor_id=None,
-            )
+        yield ReadingSample(
+            t_elapsed_s=(sample_dt - base_dt).total_seconds(),
+            temp_c=float(temp),
+            rh_pct=float(humid),
+            timestamp=sample_dt.isoformat(),
+            sensor_id=None,
         )
 
-    readings.sort(key=lambda sample: sample.t_elapsed_s)
-    return readings
-
-
-def _estimate_sampling_interval(readings: list[ReadingSample]) -> Optional[float]:
-    if len(readings) < 2:
-        return None
-
-    deltas = [
-        readings[i + 1].t_elapsed_s - readings[i].t_elapsed_s
-        for i in range(len(readings) - 1)
-        if readings[i + 1].t_elapsed_s >= readings[i].t_elapsed_s
-    ]
-    if not deltas:
-        return None
-    return sum(deltas) / len(deltas)
-
 
 def _empty_to_none(value: Optional[str]) -> Optional[str]:
     if value is None:
@@ -194,6 +347,19 @@ def _empty_to_none(value: Optional[str]) -> Optional[str]:
     return stripped or None
 
 
+@functools.lru_cache(maxsize=512)
+def _naive_offset_suffix(minute_prefix: str, default_tz: str) -> str:
+    """UTC-offset suffix (e.g. '+01:00') for a naive 'YYYY-MM-DDTHH:MM' prefix.
+
+    The offset can only change on minute boundaries, so all samples within the
+    same minute share one cached suffix; DST edges stay correct.
+    """
+    aware = dt.datetime.fromisoformat(minute_prefix + ":00").replace(
+        tzinfo=_tz_from_name(default_tz)
+    )
+    return aware.isoformat()[19:]
+
+
 def _normalize_timestamp(
     value: Optional[str],
     *,
@@ -202,6 +368,14 @@ def _normalize_timestamp(
 ) -> Optional[str]:
     if value is None:
         return None
+
+    if _regex("naive_iso").match(value):
+        normalized = f"{value[:10]}T{value[11:]}"
+        try:
+            return normalized + _naive_offset_suffix(normalized[:16], default_tz)
+        except ValueError as exc:
+            raise IngestError(f"Invalid timestamp '{value}' in {path}") from exc
+
     try:
         if value.endswith("Z"):
             dt_value = dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
@@ -215,23 +389,22 @@ def _normalize_timestamp(
     return dt_value.isoformat()
 
 
-def _detect_tzinfo(lines: list[str], *, default_tz: str) -> dt.tzinfo:
-    for line in lines:
-        match = _TZ_PAREN_PATTERN.search(line)
-        if match:
-            return _tz_from_quarters(int(match.group(1)))
-        match = _TZ_CCLK_PATTERN.search(line)
-        if match:
-            return _tz_from_quarters(int(match.group(1)))
+def _detect_tzinfo(text: str, *, default_tz: str) -> dt.tzinfo:
+    match = _regex("tz_marker").search(text)
+    if match:
+        return _tz_from_quarters(int(match.group(1) or match.group(2)))
 
     return _tz_from_name(default_tz)
 
 
+@functools.lru_cache(maxsize=None)
 def _tz_from_quarters(value: int) -> dt.tzinfo:
     return dt.timezone(dt.timedelta(minutes=value * 15))
 
 
+@functools.lru_cache(maxsize=None)
 def _tz_from_name(name: str) -> dt.tzinfo:
+    """Resolve a timezone name once per process; ZoneInfo reads tzdata on build."""
     try:
         from zoneinfo import ZoneInfo
     except ImportError as exc:
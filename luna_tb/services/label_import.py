@@ -4,19 +4,49 @@ from __future__ import annotations
 import csv
 import logging
 import pathlib
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
-from luna_tb.domain.models import LabelEvent
+from luna_tb.services._optional import _pandas
 from luna_tb.storage.db import get_connection
 from luna_tb.storage.repositories import LabelRepository
 
 LOGGER = logging.getLogger(__name__)
 
+# Parameter order of the rows yielded by _parse_labels_csv; must match the
+# column order in LabelRepository.insert_labels.
+_LABEL_COLS = (
+    "run_id",
+    "event_type",
+    "event_time_s",
+    "event_ts",
+    "volume_ml",
+    "location_label",
+    "distance_cm",
+    "water_temp_c",
+    "confidence",
+    "source",
+    "notes",
+)
+
 
 class LabelImportError(RuntimeError):
     """Raised when label import fails."""
 
 
+# Columns the stdlib path treats as text: read them as strings on the pandas
+# path too, so cells keep their exact CSV text ('5.0' stays '5.0', numeric
+# notes stay text) instead of being inferred into numbers and diverging.
+# pandas ignores dtype entries for columns a file does not have.
+_TEXT_DTYPES = {
+    "run_id": str,
+    "event_type": str,
+    "event_ts": str,
+    "location_label": str,
+    "source": str,
+    "notes": str,
+}
+
+
 def import_labels_csv(
     db_path: str | pathlib.Path,
     label_path: str | pathlib.Path,
@@ -29,60 +59,163 @@ def import_labels_csv(
     Otherwise, a run_id argument is required.
     """
     path_obj = pathlib.Path(label_path)
-    labels = _parse_labels_csv(path_obj, run_id=run_id)
-    if not labels:
-        raise LabelImportError(f"No labels parsed from {path_obj}")
-
     with get_connection(db_path) as conn:
         repo = LabelRepository(conn)
-        repo.insert_labels(labels)
+        count = repo.insert_labels(_parse_labels_csv(path_obj, run_id=run_id))
+        if count == 0:
+            raise LabelImportError(f"No labels parsed from {path_obj}")
         conn.commit()
 
-    LOGGER.info("Imported %s labels from %s", len(labels), path_obj)
-    return len(labels)
+    LOGGER.info("Imported %s labels from %s", count, path_obj)
+    return count
 
 
-def _parse_labels_csv(path: pathlib.Path, *, run_id: Optional[int]) -> list[LabelEvent]:
+def _parse_labels_csv(path: pathlib.Path, *, run_id: Optional[int]) -> Iterable[tuple]:
+    """Yield label rows as parameter tuples in _LABEL_COLS order."""
     if not path.exists():
         raise LabelImportError(f"Label path does not exist: {path}")
 
+    pd = _pandas()
+    if pd is not None:
+        return _parse_labels_csv_vectorized(path, run_id=run_id, pd=pd)
+    return _parse_labels_csv_stdlib(path, run_id=run_id)
+
+
+def _parse_labels_csv_vectorized(
+    path: pathlib.Path, *, run_id: Optional[int], pd
+) -> list[tuple]:
+    df = pd.read_csv(path, dtype=_TEXT_DTYPES)
+    df.columns = [str(name).strip() for name in df.columns]
+
+    if "event_type" not in df.columns or "event_time_s" not in df.columns:
+        raise LabelImportError(
+            "CSV requires event_type and event_time_s columns"
+        )
+
+    def _numeric(field: str, *, allow_empty: bool) -> list[Optional[float]]:
+        if field not in df.columns:
+            return [None] * len(df)
+        values = pd.to_numeric(df[field], errors="coerce")
+        invalid = values.isna() & df[field].notna()
+        if invalid.any():
+            bad = df[field][invalid].iloc[0]
+            raise LabelImportError(f"Invalid {field} value '{bad}' in {path}")
+        if not allow_empty and values.isna().any():
+            raise LabelImportError(f"Missing {field} value in {path}")
+        return [None if pd.isna(value) else float(value) for value in values]
+
+    def _strings(field: str) -> list[Optional[str]]:
+        if field not in df.columns:
+            return [None] * len(df)
+        return [
+            _empty_to_none(value) if isinstance(value, str) else None
+            for value in df[field]
+        ]
+
+    event_time_s = _numeric("event_time_s", allow_empty=False)
+    volume_ml = _numeric("volume_ml", allow_empty=True)
+    distance_cm = _numeric("distance_cm", allow_empty=True)
+    water_temp_c = _numeric("water_temp_c", allow_empty=True)
+    confidence = _numeric("confidence", allow_empty=True)
+
+    if "run_id" in df.columns:
+        # The column is read as text, so _to_int applies the stdlib path's
+        # exact parse: '5' is run 5, '5.0' and '2.5' are invalid.
+        run_ids: list[Optional[int]] = []
+        for value in df["run_id"]:
+            row_run_id = _to_int(value) if isinstance(value, str) else None
+            run_ids.append(row_run_id if row_run_id is not None else run_id)
+    else:
+        run_ids = [run_id] * len(df)
+
+    event_types = [
+        _required_str(value if isinstance(value, str) else None, "event_type", path)
+        for value in df["event_type"]
+    ]
+    event_ts = _strings("event_ts")
+    location_labels = _strings("location_label")
+    sources = _strings("source")
+    notes = _strings("notes")
+
+    rows: list[tuple] = []
+    for i in range(len(df)):
+        if run_ids[i] is None:
+            raise LabelImportError(
+                "run_id missing: supply --run-id or include run_id column"
+            )
+        rows.append(
+            (
+                run_ids[i],
+                event_types[i],
+                event_time_s[i],
+                event_ts[i],
+                volume_ml[i],
+                location_labels[i],
+                distance_cm[i],
+                water_temp_c[i],
+                confidence[i],
+                sources[i],
+                notes[i],
+            )
+        )
+
+    return rows
+
+
+def _parse_labels_csv_stdlib(path: pathlib.Path, *, run_id: Optional[int]) -> Iterator[tuple]:
     with path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        if reader.fieldnames is None:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
             raise LabelImportError(f"Missing header row in {path}")
 
-        fieldnames = {name.strip() for name in reader.fieldnames}
-        if "event_type" not in fieldnames or "event_time_s" not in fieldnames:
+        indices = {name.strip(): i for i, name in enumerate(header)}
+        if "event_type" not in indices or "event_time_s" not in indices:
             raise LabelImportError(
                 "CSV requires event_type and event_time_s columns"
             )
 
-        labels: list[LabelEvent] = []
+        run_idx = indices.get("run_id")
+        type_idx = indices["event_type"]
+        time_idx = indices["event_time_s"]
+        ts_idx = indices.get("event_ts")
+        volume_idx = indices.get("volume_ml")
+        location_idx = indices.get("location_label")
+        distance_idx = indices.get("distance_cm")
+        water_idx = indices.get("water_temp_c")
+        confidence_idx = indices.get("confidence")
+        source_idx = indices.get("source")
+        notes_idx = indices.get("notes")
+
         for row in reader:
-            row_run_id = _to_int(row.get("run_id")) if "run_id" in fieldnames else None
+            if not row:
+                continue
+            row_run_id = _to_int(_cell(row, run_idx))
             effective_run_id = row_run_id if row_run_id is not None else run_id
             if effective_run_id is None:
                 raise LabelImportError(
                     "run_id missing: supply --run-id or include run_id column"
                 )
 
-            labels.append(
-                LabelEvent(
-                    run_id=effective_run_id,
-                    event_type=_required_str(row.get("event_type"), "event_type", path),
-                    event_time_s=_to_float(row.get("event_time_s"), "event_time_s", path),
-                    event_ts=_empty_to_none(row.get("event_ts")),
-                    volume_ml=_to_float(row.get("volume_ml"), "volume_ml", path, allow_empty=True),
-                    location_label=_empty_to_none(row.get("location_label")),
-                    distance_cm=_to_float(row.get("distance_cm"), "distance_cm", path, allow_empty=True),
-                    water_temp_c=_to_float(row.get("water_temp_c"), "water_temp_c", path, allow_empty=True),
-                    confidence=_to_float(row.get("confidence"), "confidence", path, allow_empty=True),
-                    source=_empty_to_none(row.get("source")),
-                    notes=_empty_to_none(row.get("notes")),
-                )
+            yield (
+                effective_run_id,
+                _required_str(_cell(row, type_idx), "event_type", path),
+                _to_float(_cell(row, time_idx), "event_time_s", path),
+                _empty_to_none(_cell(row, ts_idx)),
+                _to_float(_cell(row, volume_idx), "volume_ml", path, allow_empty=True),
+                _empty_to_none(_cell(row, location_idx)),
+                _to_float(_cell(row, distance_idx), "distance_cm", path, allow_empty=True),
+                _to_float(_cell(row, water_idx), "water_temp_c", path, allow_empty=True),
+                _to_float(_cell(row, confidence_idx), "confidence", path, allow_empty=True),
+                _empty_to_none(_cell(row, source_idx)),
+                _empty_to_none(_cell(row, notes_idx)),
             )
 
-    return labels
+
+def _cell(row: list[str], index: Optional[int]) -> Optional[str]:
+    if index is None or index >= len(row):
+        return None
+    return row[index]
 
 
 def _required_str(value: Optional[str], field: str, path: pathlib.Path) -> str:
@@ -1,15 +1,24 @@
 """Run registry import service for lab tracking sheets."""
 from __future__ import annotations
 
+import concurrent.futures
 import csv
 import datetime as dt
+import functools
+import itertools
 import pathlib
 import re
-import xml.etree.ElementTree as ET
 import zipfile
-from typing import Any
+from typing import Any, Iterable, NamedTuple
+
+try:
+    # Optional 'fast' extra: libxml2-backed parser, same ElementPath API.
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
 
 from luna_tb.domain.models import RunRegistryEntry
+from luna_tb.services._optional import _pandas
 from luna_tb.storage.db import get_connection
 from luna_tb.storage.repositories import RunRegistryRepository
 
@@ -18,19 +27,37 @@ class RegistryImportError(RuntimeError):
     """Raised when run registry import fails."""
 
 
-_COLUMN_MAP = {
-    "runid": "external_run_id",
-    "test status": "status",
-    "timestamp": "planned_or_recorded_ts",
-    "test device": "test_device",
-    "sensor cap": "sensor_cap",
-    "diaper type": "diaper_type",
-    "findings / comments": "findings_comments",
-    "test protocol": "test_protocol",
-    "test result": "test_result_ref",
-    "log file": "log_file_ref",
-}
+@functools.lru_cache(maxsize=None)
+def _calamine():
+    """Return CalamineWorkbook if the optional 'fast' extra is installed.
+
+    python-calamine parses XLSX in compiled Rust; the hand-rolled XML reader
+    below stays as the dependency-free fallback.
+    """
+    try:
+        from python_calamine import CalamineWorkbook
+    except ImportError:
+        return None
+    return CalamineWorkbook
+
+
+_WS_RE = re.compile(r"\s+")
 
+# Matches the date / date-time shapes the registry sheets actually contain
+# ("YYYY-MM-DD", optionally followed by " HH:MM" or " HH:MM:SS"); one match
+# replaces the strptime format cascade on the per-row hot path. Components
+# allow one or two digits because strptime did ("2026-1-2" is a valid date).
+_TS_RE = re.compile(
+    r"^(\d{4})-(\d{1,2})-(\d{1,2})(?:[ T](\d{1,2}):(\d{1,2})(?::(\d{1,2}))?)?$"
+)
+
+_MAIN_NS = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_ROW_TAG = f"{{{_MAIN_NS}}}row"
+_CELL_TAG = f"{{{_MAIN_NS}}}c"
+_SI_TAG = f"{{{_MAIN_NS}}}si"
+_VALUE_TAG = f"{{{_MAIN_NS}}}v"
+_INLINE_STR_TAG = f"{{{_MAIN_NS}}}is"
+_TEXT_TAG = f"{{{_MAIN_NS}}}t"
 
 def import_run_registry(
     db_path: str | pathlib.Path,
@@ -41,14 +68,8 @@ def import_run_registry(
 ) -> int:
     """Import registry rows from a spreadsheet export and upsert by external run id."""
     path_obj = pathlib.Path(file_path)
-    suffix = path_obj.suffix.lower()
-    if suffix == ".csv":
-        entries = _parse_registry_csv(path_obj, default_tz=default_tz)
-    elif suffix == ".xlsx":
-        entries = _parse_registry_xlsx(path_obj, sheet_name=sheet_name, default_tz=default_tz)
-    else:
-        raise RegistryImportError(f"Unsupported registry format: {path_obj.suffix}")
-
+    tzinfo = _tz_from_name(default_tz)
+    entries = _parse_registry_file(path_obj, sheet_name=sheet_name, tzinfo=tzinfo)
     if not entries:
         raise RegistryImportError(f"No registry rows found in {path_obj}")
 
@@ -59,21 +80,77 @@ def import_run_registry(
         return count
 
 
-def _parse_registry_csv(path: pathlib.Path, *, default_tz: str) -> list[RunRegistryEntry]:
+def import_run_registries(
+    db_path: str | pathlib.Path,
+    file_paths: Iterable[str | pathlib.Path],
+    *,
+    sheet_name: str = "test runs",
+    default_tz: str = "Europe/Berlin",
+) -> int:
+    """Import several registry files and upsert all rows in one transaction.
+
+    Parsing is CPU-bound (XML/CSV decode plus row mapping) and each file is
+    independent, so files are parsed in worker processes; the database write
+    stays in this process as a single commit. File order is preserved, so
+    re-imports stay deterministic when files overlap on external run ids.
+    """
+    path_objs = [pathlib.Path(p) for p in file_paths]
+    if not path_objs:
+        raise RegistryImportError("No registry files given")
+
+    parse = functools.partial(
+        _parse_registry_file, sheet_name=sheet_name, tzinfo=_tz_from_name(default_tz)
+    )
+    if len(path_objs) == 1:
+        entry_lists = [parse(path_objs[0])]
+    else:
+        with concurrent.futures.ProcessPoolExecutor() as executor:
+            entry_lists = list(executor.map(parse, path_objs))
+
+    for path_obj, entries in zip(path_objs, entry_lists):
+        if not entries:
+            raise RegistryImportError(f"No registry rows found in {path_obj}")
+
+    with get_connection(db_path) as conn:
+        repo = RunRegistryRepository(conn)
+        count = repo.upsert_entries(itertools.chain.from_iterable(entry_lists))
+        conn.commit()
+        return count
+
+
+def _parse_registry_file(
+    path: pathlib.Path,
+    *,
+    sheet_name: str,
+    tzinfo: dt.tzinfo,
+) -> list[RunRegistryEntry]:
+    suffix = path.suffix.lower()
+    if suffix == ".csv":
+        return _parse_registry_csv(path, tzinfo=tzinfo)
+    if suffix == ".xlsx":
+        return _parse_registry_xlsx(path, sheet_name=sheet_name, tzinfo=tzinfo)
+    raise RegistryImportError(f"Unsupported registry format: {path.suffix}")
+
+
+def _parse_registry_csv(path: pathlib.Path, *, tzinfo: dt.tzinfo) -> list[RunRegistryEntry]:
     if not path.exists():
         raise RegistryImportError(f"Registry file does not exist: {path}")
 
     with path.open("r", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        if reader.fieldnames is None:
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
             raise RegistryImportError(f"Missing header row in {path}")
 
-        normalized = {_normalize_header(h): h for h in reader.fieldnames if h is not None}
+        # Resolve header positions once; rows stay plain lists so no per-row
+        # dict is allocated (csv.DictReader builds one per record).
+        normalized = {_normalize_header(h): i for i, h in enumerate(header) if h}
         _validate_required_headers(normalized)
+        resolved = _resolve_columns(normalized)
 
         entries: list[RunRegistryEntry] = []
         for idx, row in enumerate(reader, start=2):
-            mapped = _map_row(row, normalized, path, idx, default_tz=default_tz)
+            mapped = _map_row(row, resolved, path, idx, tzinfo=tzinfo)
             if mapped is not None:
                 entries.append(mapped)
 
@@ -84,22 +161,58 @@ def _parse_registry_xlsx(
     path: pathlib.Path,
     *,
     sheet_name: str,
-    default_tz: str,
+    tzinfo: dt.tzinfo,
 ) -> list[RunRegistryEntry]:
     if not path.exists():
         raise RegistryImportError(f"Registry file does not exist: {path}")
 
+    workbook_cls = _calamine()
+    if workbook_cls is not None:
+        return _parse_registry_xlsx_calamine(
+            path, sheet_name=sheet_name, tzinfo=tzinfo, workbook_cls=workbook_cls
+        )
+    return _parse_registry_xlsx_xml(path, sheet_name=sheet_name, tzinfo=tzinfo)
+
+
+def _parse_registry_xlsx_calamine(
+    path: pathlib.Path,
+    *,
+    sheet_name: str,
+    tzinfo: dt.tzinfo,
+    workbook_cls,
+) -> list[RunRegistryEntry]:
+    workbook = workbook_cls.from_path(str(path))
+    normalized_target = _normalize_sheet_name(sheet_name)
+    target = next(
+        (name for name in workbook.sheet_names if _normalize_sheet_name(name) == normalized_target),
+        None,
+    )
+    if target is None:
+        raise RegistryImportError(f"Sheet '{sheet_name}' not found in {path}")
+
+    row_values = workbook.get_sheet_by_name(target).to_python()
+    return _rows_to_entries(row_values, path, tzinfo=tzinfo)
+
+
+def _parse_registry_xlsx_xml(
+    path: pathlib.Path,
+    *,
+    sheet_name: str,
+    tzinfo: dt.tzinfo,
+) -> list[RunRegistryEntry]:
     ns = {
         "main": "http://schemas.openxmlformats.org/spreadsheetml/2006/main",
         "rel": "http://schemas.openxmlformats.org/package/2006/relationships",
     }
 
     with zipfile.ZipFile(path) as zf:
-        workbook = ET.fromstring(zf.read("xl/workbook.xml"))
-        rels = ET.fromstring(zf.read("xl/_rels/workbook.xml.rels"))
+        with zf.open("xl/workbook.xml") as handle:
+            workbook = ET.parse(handle).getroot()
+        with zf.open("xl/_rels/workbook.xml.rels") as handle:
+            rels = ET.parse(handle).getroot()
         rel_by_id = {node.attrib["Id"]: node.attrib["Target"] for node in rels.findall("rel:Relationship", ns)}
 
-        shared_strings = _load_shared_strings(zf, ns)
+        shared_strings = _load_shared_strings(zf)
 
         target_sheet = None
         normalized_target = _normalize_sheet_name(sheet_name)
@@ -116,66 +229,177 @@ def _parse_registry_xlsx(
         if target_sheet is None:
             raise RegistryImportError(f"Sheet '{sheet_name}' not found in {path}")
 
-        ws = ET.fromstring(zf.read(target_sheet))
-
-        row_values: list[list[str]] = []
-        for row in ws.findall("main:sheetData/main:row", ns):
-            row_cells: dict[int, str] = {}
-            max_col = 0
-            for cell in row.findall("main:c", ns):
-                ref = cell.attrib.get("r")
-                if not ref:
+        # Stream the worksheet row by row and map each data row to an entry
+        # as soon as its cells are decoded: no intermediate list of row
+        # values, so peak memory stays independent of the sheet size.
+        entries: list[RunRegistryEntry] = []
+        resolved: _ColumnPositions | None = None
+        row_num = 0
+        with zf.open(target_sheet) as handle:
+            for _event, row in ET.iterparse(handle, events=("end",)):
+                if row.tag != _ROW_TAG:
+                    continue
+                values = _row_values(row, shared_strings)
+                row.clear()
+                row_num += 1
+
+                if resolved is None:
+                    normalized = {_normalize_header(h): i for i, h in enumerate(values) if h}
+                    _validate_required_headers(normalized)
+                    resolved = _resolve_columns(normalized)
                     continue
-                col = _column_index(ref)
-                max_col = max(max_col, col)
-                row_cells[col] = _xlsx_cell_value(cell, ns, shared_strings)
 
-            values = [row_cells.get(i, "") for i in range(1, max_col + 1)]
-            row_values.append(values)
+                mapped = _map_row(values, resolved, path, row_num, tzinfo=tzinfo)
+                if mapped is not None:
+                    entries.append(mapped)
+
+    return entries
+
+
+def _row_values(row: ET.Element, shared_strings: list[str]) -> list[str]:
+    """Decode one worksheet <row> into a dense list of cell values."""
+    row_cells: dict[int, str] = {}
+    max_col = 0
+    expected_col = 1
+    for cell in row:
+        if cell.tag != _CELL_TAG:
+            continue
+        # Cells normally appear in document order; only consult the r=
+        # reference when present, assuming the next column otherwise (the
+        # reference is optional per the spec).
+        ref = cell.attrib.get("r")
+        col = _column_index(ref) if ref else expected_col
+        expected_col = col + 1
+        max_col = max(max_col, col)
+        row_cells[col] = _xlsx_cell_value(cell, shared_strings)
+
+    return [row_cells.get(i, "") for i in range(1, max_col + 1)]
+
 
+def _rows_to_entries(
+    row_values: list[list[Any]],
+    path: pathlib.Path,
+    *,
+    tzinfo: dt.tzinfo,
+) -> list[RunRegistryEntry]:
+    """Map a header row plus data rows (any cell type) to registry entries."""
     if not row_values:
         return []
 
-    headers = row_values[0]
-    normalized = {_normalize_header(h): h for h in headers if h}
+    headers = [str(h) if h is not None else "" for h in row_values[0]]
+    normalized = {_normalize_header(h): i for i, h in enumerate(headers) if h}
     _validate_required_headers(normalized)
+    resolved = _resolve_columns(normalized)
 
-    header_to_pos = {h: i for i, h in enumerate(headers)}
+    data_rows = row_values[1:]
+    ts_column = _prenormalize_ts_column(data_rows, resolved, tzinfo=tzinfo)
 
     entries: list[RunRegistryEntry] = []
-    for row_num, values in enumerate(row_values[1:], start=2):
-        row_dict = {
-            header: values[pos] if pos < len(values) else ""
-            for header, pos in header_to_pos.items()
-        }
-        mapped = _map_row(row_dict, normalized, path, row_num, default_tz=default_tz)
+    for offset, values in enumerate(data_rows):
+        mapped = _map_row(
+            values,
+            resolved,
+            path,
+            offset + 2,
+            tzinfo=tzinfo,
+            prenormalized_ts=ts_column[offset] if ts_column is not None else _NOT_PRENORMALIZED,
+        )
         if mapped is not None:
             entries.append(mapped)
 
     return entries
 
 
-def _load_shared_strings(zf: zipfile.ZipFile, ns: dict[str, str]) -> list[str]:
+def _prenormalize_ts_column(
+    data_rows: list[list[Any]],
+    columns: _ColumnPositions,
+    *,
+    tzinfo: dt.tzinfo,
+) -> list[str | None] | None:
+    """Normalize the whole timestamp column at once when pandas is available.
+
+    Only values matching _TS_RE — the exact shapes the per-row fast path
+    recognizes — are handed to the vectorized to_datetime call; every other
+    value (Excel serials, odd formats, unparseable text) goes through
+    _normalize_timestamp individually. This keeps the result identical to
+    the stdlib path cell for cell: pandas would otherwise accept formats
+    like '02/03/2024' or a bare year that the per-row path leaves raw or
+    treats as a serial. Returns None when pandas is missing or the sheet
+    has no timestamp column.
+    """
+    pd = _pandas()
+    if pd is None or not data_rows:
+        return None
+    ts_pos = columns.planned_or_recorded_ts
+    if ts_pos is None:
+        return None
+
+    cleaned = [
+        _clean_str(row[ts_pos]) if ts_pos < len(row) else None for row in data_rows
+    ]
+    vec_idx = [
+        i for i, value in enumerate(cleaned)
+        if value is not None and _TS_RE.match(value) is not None
+    ]
+    vectorized: dict[int, str] = {}
+    if vec_idx:
+        try:
+            parsed = pd.to_datetime(
+                pd.Series([cleaned[i] for i in vec_idx], dtype="object"),
+                errors="coerce",
+                format="mixed",
+            ).dt.tz_localize(tzinfo)
+        except Exception:  # noqa: BLE001 - per-row path handles the column instead
+            parsed = None
+        if parsed is not None:
+            vectorized = {
+                i: ts.isoformat() for i, ts in zip(vec_idx, parsed) if pd.notna(ts)
+            }
+
+    return [
+        vectorized[i] if i in vectorized else _normalize_timestamp(value, tzinfo=tzinfo)
+        for i, value in enumerate(cleaned)
+    ]
+
+
+def _load_shared_strings(zf: zipfile.ZipFile) -> list[str]:
     if "xl/sharedStrings.xml" not in zf.namelist():
         return []
 
-    root = ET.fromstring(zf.read("xl/sharedStrings.xml"))
     values: list[str] = []
-    for si in root.findall("main:si", ns):
-        text = "".join(node.text or "" for node in si.findall(".//main:t", ns))
-        values.append(text)
+    with zf.open("xl/sharedStrings.xml") as handle:
+        for _event, si in ET.iterparse(handle, events=("end",)):
+            if si.tag != _SI_TAG:
+                continue
+            # itertext() walks descendant text directly, skipping the element
+            # list that findall(".//main:t") would materialize per entry.
+            values.append("".join(si.itertext()))
+            si.clear()
     return values
 
 
-def _xlsx_cell_value(cell: ET.Element, ns: dict[str, str], shared_strings: list[str]) -> str:
-    cell_type = cell.attrib.get("t")
-    value_node = cell.find("main:v", ns)
+def _xlsx_cell_value(cell: ET.Element, shared_strings: list[str]) -> str:
+    # A cell has at most a handful of children; walking them against the
+    # precomputed qualified names skips the ElementPath parse + namespace
+    # resolution that cell.find("main:v", ns) pays on every call.
+    value_node = None
+    inline_node = None
+    for child in cell:
+        if child.tag == _VALUE_TAG:
+            value_node = child
+            break
+        if child.tag == _INLINE_STR_TAG:
+            inline_node = child
+
     if value_node is None:
-        inline = cell.find("main:is/main:t", ns)
-        return (inline.text or "") if inline is not None else ""
+        if inline_node is not None:
+            for text_node in inline_node:
+                if text_node.tag == _TEXT_TAG:
+                    return text_node.text or ""
+        return ""
 
     raw = value_node.text or ""
-    if cell_type == "s":
+    if cell.attrib.get("t") == "s":
         try:
             return shared_strings[int(raw)]
         except Exception:
@@ -184,49 +408,129 @@ def _xlsx_cell_value(cell: ET.Element, ns: dict[str, str], shared_strings: list[
 
 
 def _column_index(cell_ref: str) -> int:
-    letters = "".join(ch for ch in cell_ref if ch.isalpha())
+    # The letter prefix repeats for every row ("A1", "A2", ...), so decoding
+    # is cached on the prefix alone.
+    return _letters_to_index(cell_ref.rstrip("0123456789"))
+
+
+@functools.lru_cache(maxsize=None)
+def _letters_to_index(letters: str) -> int:
+    # Column prefixes are at most three letters ("XFD" is the XLSX maximum),
+    # so the base-26 decode is unrolled; `& 31` maps both cases of a letter
+    # to its alphabet position without an upper() call.
+    n = len(letters)
+    if n == 1:
+        return ord(letters) & 31
+    if n == 2:
+        return (ord(letters[0]) & 31) * 26 + (ord(letters[1]) & 31)
+    if n == 3:
+        return (
+            (ord(letters[0]) & 31) * 676
+            + (ord(letters[1]) & 31) * 26
+            + (ord(letters[2]) & 31)
+        )
     idx = 0
     for ch in letters:
-        idx = idx * 26 + (ord(ch.upper()) - ord("A") + 1)
+        idx = idx * 26 + (ord(ch) & 31)
     return idx
 
 
+class _ColumnPositions(NamedTuple):
+    """Column position of each registry field in a sheet, resolved per file.
+
+    Field names match the RunRegistryEntry fields they feed; None means the
+    sheet has no column for that field.
+    """
+
+    external_run_id: int | None
+    status: int | None
+    planned_or_recorded_ts: int | None
+    test_device: int | None
+    sensor_cap: int | None
+    diaper_type: int | None
+    findings_comments: int | None
+    test_protocol: int | None
+    test_result_ref: int | None
+    log_file_ref: int | None
+
+
+def _resolve_columns(normalized_headers: dict[str, int]) -> _ColumnPositions:
+    """Resolve the known header names to positions once per file."""
+    get = normalized_headers.get
+    return _ColumnPositions(
+        external_run_id=get("runid"),
+        status=get("test status"),
+        planned_or_recorded_ts=get("timestamp"),
+        test_device=get("test device"),
+        sensor_cap=get("sensor cap"),
+        diaper_type=get("diaper type"),
+        findings_comments=get("findings / comments"),
+        test_protocol=get("test protocol"),
+        test_result_ref=get("test result"),
+        log_file_ref=get("log file"),
+    )
+
+
+# Sentinel distinguishing "no prenormalized timestamp supplied" from an
+# explicit None (empty cell) in _map_row.
+_NOT_PRENORMALIZED: Any = object()
+
+
 def _map_row(
-    row: dict[str, Any],
-    normalized_headers: dict[str, str],
+    row: list[Any],
+    columns: _ColumnPositions,
     source_file: pathlib.Path,
     source_row_number: int,
     *,
-    default_tz: str,
+    tzinfo: dt.tzinfo,
+    prenormalized_ts: str | None = _NOT_PRENORMALIZED,
 ) -> RunRegistryEntry | None:
-    external_header = normalized_headers["runid"]
-    external_run_id = _clean_str(row.get(external_header))
+    # Straight-line extraction: one slot per field, no loop over a column map
+    # and no intermediate dict per row.
+    n = len(row)
+
+    p = columns.external_run_id
+    external_run_id = _clean_str(row[p]) if p is not None and p < n else None
     if not external_run_id:
         return None
 
-    mapped: dict[str, str | None] = {}
-    for source_name, target_name in _COLUMN_MAP.items():
-        header = normalized_headers.get(source_name)
-        raw = row.get(header) if header is not None else None
-        cleaned = _clean_str(raw)
-        mapped[target_name] = cleaned
-
-    mapped["planned_or_recorded_ts"] = _normalize_timestamp(
-        mapped.get("planned_or_recorded_ts"),
-        default_tz=default_tz,
-    )
+    if prenormalized_ts is _NOT_PRENORMALIZED:
+        p = columns.planned_or_recorded_ts
+        planned_or_recorded_ts = _normalize_timestamp(
+            _clean_str(row[p]) if p is not None and p < n else None,
+            tzinfo=tzinfo,
+        )
+    else:
+        planned_or_recorded_ts = prenormalized_ts
+
+    p = columns.status
+    status = _clean_str(row[p]) if p is not None and p < n else None
+    p = columns.test_device
+    test_device = _clean_str(row[p]) if p is not None and p < n else None
+    p = columns.sensor_cap
+    sensor_cap = _clean_str(row[p]) if p is not None and p < n else None
+    p = columns.diaper_type
+    diaper_type = _clean_str(row[p]) if p is not None and p < n else None
+    p = columns.findings_comments
+    findings_comments = _clean_str(row[p]) if p is not None and p < n else None
+    p = columns.test_protocol
+    test_protocol = _clean_str(row[p]) if p is not None and p < n else None
+    p = columns.test_result_ref
+    test_result_ref = _clean_str(row[p]) if p is not None and p < n else None
+    p = columns.log_file_ref
+    log_file_ref = _clean_str(row[p]) if p is not None and p < n else None
 
     return RunRegistryEntry(
         external_run_id=external_run_id,
-        status=mapped.get("status"),
-        planned_or_recorded_ts=mapped.get("planned_or_recorded_ts"),
-        test_device=mapped.get("test_device"),
-        sensor_cap=mapped.get("sensor_cap"),
-        diaper_type=mapped.get("diaper_type"),
-        findings_comments=mapped.get("findings_comments"),
-        test_protocol=mapped.get("test_protocol"),
-        test_result_ref=mapped.get("test_result_ref"),
-        log_file_ref=mapped.get("log_file_ref"),
+        status=status,
+        planned_or_recorded_ts=planned_or_recorded_ts,
+        test_device=test_device,
+        sensor_cap=sensor_cap,
+        diaper_type=diaper_type,
+        findings_comments=findings_comments,
+        test_protocol=test_protocol,
+        test_result_ref=test_result_ref,
+        log_file_ref=log_file_ref,
         source_file=source_file.name,
         source_row_number=source_row_number,
     )
@@ -239,7 +543,7 @@ def _validate_required_headers(normalized_headers: dict[str, str]) -> None:
 
 
 def _normalize_header(value: str) -> str:
-    return re.sub(r"\s+", " ", value.strip().lower())
+    return _WS_RE.sub(" ", value.strip().lower())
 
 
 def _normalize_sheet_name(value: str) -> str:
@@ -249,15 +553,36 @@ def _normalize_sheet_name(value: str) -> str:
 def _clean_str(value: Any) -> str | None:
     if value is None:
         return None
+    if isinstance(value, float) and value.is_integer():
+        # calamine returns integral numeric cells as floats; str() would
+        # yield '1001.0' where the XML reader sees the cell text '1001'.
+        value = int(value)
     text = str(value).strip()
     return text or None
 
 
-def _normalize_timestamp(value: str | None, *, default_tz: str) -> str | None:
+def _normalize_timestamp(value: str | None, *, tzinfo: dt.tzinfo) -> str | None:
     if value is None:
         return None
 
-    tzinfo = _tz_from_name(default_tz)
+    match = _TS_RE.match(value)
+    if match is not None:
+        year, month, day, hour, minute, second = match.groups()
+        try:
+            dt_value = dt.datetime(
+                int(year),
+                int(month),
+                int(day),
+                int(hour or 0),
+                int(minute or 0),
+                int(second or 0),
+                tzinfo=tzinfo,
+            )
+        except ValueError:
+            # Right shape, impossible date (e.g. month 13): keep the raw text,
+            # matching what the strptime cascade used to do.
+            return value
+        return dt_value.isoformat()
 
     # Excel serial timestamp.
     try:
@@ -270,14 +595,6 @@ def _normalize_timestamp(value: str | None, *, default_tz: str) -> str | None:
     except ValueError:
         pass
 
-    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d %H:%M", "%Y-%m-%d"):
-        try:
-            dt_value = dt.datetime.strptime(value, fmt)
-            dt_value = dt_value.replace(tzinfo=tzinfo)
-            return dt_value.isoformat()
-        except ValueError:
-            continue
-
     try:
         dt_value = dt.datetime.fromisoformat(value)
         if dt_value.tzinfo is None:
@@ -287,6 +604,7 @@ def _normalize_timestamp(value: str | None, *, default_tz: str) -> str | None:
         return value
 
 
+@functools.lru_cache(maxsize=None)
 def _tz_from_name(name: str) -> dt.tzinfo:
     try:
         from zoneinfo import ZoneInfo
@@ -1,10 +1,12 @@
 """SQLite storage utilities and migrations."""
 from __future__ import annotations
 
+import collections
 import datetime as dt
 import logging
 import pathlib
 import sqlite3
+import threading
 from typing import Iterable
 
 LOGGER = logging.getLogger(__name__)
@@ -15,11 +17,53 @@ class MigrationError(RuntimeError):
 
 
 def get_connection(db_path: str | pathlib.Path) -> sqlite3.Connection:
-    path_obj = pathlib.Path(db_path)
-    conn = sqlite3.connect(path_obj)
-    conn.row_factory = sqlite3.Row
-    conn.execute("PRAGMA foreign_keys = ON;")
-    return conn
+    """Return the long-lived connection for a database path.
+
+    Connections are cached per resolved path, so repeated imports against the
+    same database reuse one connection (and its PRAGMA setup, page cache and
+    prepared statements) instead of paying the open cost each call. Callers
+    use ``with get_connection(...) as conn`` for transaction scope only — the
+    sqlite3 context manager commits or rolls back without closing, which is
+    exactly what keeps the cached connection reusable.
+    """
+    return _connect(str(pathlib.Path(db_path).resolve()))
+
+
+# Most-recently-used connections by resolved path; the least recently used
+# one is closed (releasing its WAL files and rolling back any uncommitted
+# work) when the cache grows past _MAX_CACHED_CONNECTIONS.
+_MAX_CACHED_CONNECTIONS = 8
+_CONNECTIONS: collections.OrderedDict[str, sqlite3.Connection] = collections.OrderedDict()
+_CONNECTIONS_LOCK = threading.Lock()
+
+
+def _connect(resolved_path: str) -> sqlite3.Connection:
+    with _CONNECTIONS_LOCK:
+        conn = _CONNECTIONS.get(resolved_path)
+        if conn is not None:
+            _CONNECTIONS.move_to_end(resolved_path)
+            return conn
+
+        # check_same_thread=False lets the cached connection serve whichever
+        # thread picks up the next batch; access stays serialized through the
+        # transaction scopes the services already use.
+        conn = sqlite3.connect(resolved_path, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA foreign_keys = ON;")
+        # Bulk-ingest friendly settings: WAL avoids writer/reader blocking and
+        # synchronous=NORMAL drops the per-commit fsync while staying crash-safe
+        # in WAL mode. Results are unaffected; only durability of the very last
+        # commit on power loss is traded, which re-running an import repairs.
+        conn.execute("PRAGMA journal_mode = WAL;")
+        conn.execute("PRAGMA synchronous = NORMAL;")
+        conn.execute("PRAGMA temp_store = MEMORY;")
+        conn.execute("PRAGMA cache_size = -65536;")
+
+        _CONNECTIONS[resolved_path] = conn
+        while len(_CONNECTIONS) > _MAX_CACHED_CONNECTIONS:
+            _, evicted = _CONNECTIONS.popitem(last=False)
+            evicted.close()
+        return conn
 
 
 def init_db(db_path: str | pathlib.Path, migrations_dir: str | pathlib.Path) -> None:
@@ -49,23 +93,33 @@ def apply_migrations(conn: sqlite3.Connection, migrations_dir: str | pathlib.Pat
     migration_files = sorted(
         p for p in migrations_path.iterdir() if p.is_file() and p.suffix == ".sql"
     )
-    for migration in migration_files:
-        version = migration.stem
-        if version in applied:
-            continue
-
+    pending = [m for m in migration_files if m.stem not in applied]
+    if not pending:
+        return
+
+    # All pending migrations run as one executescript transaction: a single
+    # fsync instead of one per file, and a failure anywhere leaves the schema
+    # untouched. executescript cannot take parameters, so the version marker
+    # values are quote-escaped inline.
+    applied_at = _utc_now()
+    parts = ["BEGIN;"]
+    for migration in pending:
         LOGGER.info("Applying migration %s", migration.name)
-        sql = migration.read_text(encoding="utf-8")
-        try:
-            conn.executescript(sql)
-            conn.execute(
-                "INSERT INTO schema_migrations (version, applied_at) VALUES (?, ?);",
-                (version, _utc_now()),
-            )
-            conn.commit()
-        except sqlite3.DatabaseError as exc:
-            conn.rollback()
-            raise MigrationError(f"Failed migration {migration.name}: {exc}") from exc
+        sql = migration.read_text(encoding="utf-8").rstrip()
+        parts.append(sql if sql.endswith(";") else f"{sql};")
+        version = migration.stem.replace("'", "''")
+        parts.append(
+            "INSERT INTO schema_migrations (version, applied_at) "
+            f"VALUES ('{version}', '{applied_at}');"
+        )
+    parts.append("COMMIT;")
+
+    try:
+        conn.executescript("\n".join(parts))
+    except sqlite3.DatabaseError as exc:
+        conn.rollback()
+        names = ", ".join(m.name for m in pending)
+        raise MigrationError(f"Failed applying migrations ({names}): {exc}") from exc
 
 
 def _utc_now() -> str:
@@ -0,0 +1,11 @@
+-- Index plain equality lookups on run_registry.log_file_ref.
+--
+-- The partial unique index from 0002 cannot serve `log_file_ref = ?` probes:
+-- the planner cannot prove a bound parameter satisfies the `<> ''` condition,
+-- so those queries fall back to a table scan. A full (non-unique) index keeps
+-- them O(log N); uniqueness of non-empty refs stays with the partial index.
+
+PRAGMA foreign_keys = ON;
+
+CREATE INDEX IF NOT EXISTS idx_run_registry_log_file_ref
+ON run_registry(log_file_ref);
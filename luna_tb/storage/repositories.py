@@ -1,10 +1,36 @@
 """Repository layer for storage access."""
 from __future__ import annotations
 
+import operator
 import sqlite3
 from typing import Iterable
 
-from luna_tb.domain.models import LabelEvent, ReadingSample, RunMetadata, RunRegistryEntry
+from luna_tb.domain.models import ReadingSample, RunMetadata, RunRegistryEntry
+
+# Column extractors for bulk inserts: one C-level attrgetter call per row
+# instead of one Python attribute lookup per field. Order matches the
+# placeholder order of the corresponding INSERT statements.
+_READING_COLS = operator.attrgetter(
+    "timestamp",
+    "t_elapsed_s",
+    "sensor_id",
+    "temp_c",
+    "rh_pct",
+)
+_REGISTRY_COLS = operator.attrgetter(
+    "external_run_id",
+    "status",
+    "planned_or_recorded_ts",
+    "test_device",
+    "sensor_cap",
+    "diaper_type",
+    "test_protocol",
+    "findings_comments",
+    "test_result_ref",
+    "log_file_ref",
+    "source_file",
+    "source_row_number",
+)
 
 
 class RunRepository:
@@ -50,23 +76,40 @@ class RunRepository:
         )
         return int(cursor.lastrowid)
 
+    def update_run_window(
+        self,
+        run_id: int,
+        *,
+        start_ts: str | None,
+        end_ts: str | None,
+        sampling_interval_s: float | None,
+    ) -> None:
+        self._conn.execute(
+            "UPDATE runs SET start_ts = ?, end_ts = ?, sampling_interval_s = ? WHERE run_id = ?;",
+            (start_ts, end_ts, sampling_interval_s, run_id),
+        )
+
+
+def _begin_immediate(conn: sqlite3.Connection) -> None:
+    """Take the write lock up-front for a bulk insert.
+
+    No-op when the caller already opened a transaction (sqlite3 starts one
+    implicitly on the first DML statement)."""
+    if not conn.in_transaction:
+        conn.execute("BEGIN IMMEDIATE;")
+
 
 class ReadingRepository:
     def __init__(self, conn: sqlite3.Connection) -> None:
         self._conn = conn
 
     def insert_readings(self, run_id: int, readings: Iterable[ReadingSample]) -> None:
-        rows = [
-            (
-                run_id,
-                reading.timestamp,
-                reading.t_elapsed_s,
-                reading.sensor_id,
-                reading.temp_c,
-                reading.rh_pct,
-            )
-            for reading in readings
-        ]
+        """Insert readings; accepts any iterable, including generators.
+
+        Rows stream straight into executemany, which consumes the iterable one
+        row at a time, so the full reading set is never held in memory here.
+        """
+        _begin_immediate(self._conn)
         self._conn.executemany(
             """
             INSERT INTO readings (
@@ -78,7 +121,7 @@ class ReadingRepository:
                 rh_pct
             ) VALUES (?, ?, ?, ?, ?, ?)
             """,
-            rows,
+            ((run_id, *_READING_COLS(reading)) for reading in readings),
         )
 
 
@@ -86,24 +129,14 @@ class LabelRepository:
     def __init__(self, conn: sqlite3.Connection) -> None:
         self._conn = conn
 
-    def insert_labels(self, labels: Iterable[LabelEvent]) -> None:
-        rows = [
-            (
-                label.run_id,
-                label.event_type,
-                label.event_time_s,
-                label.event_ts,
-                label.volume_ml,
-                label.location_label,
-                label.distance_cm,
-                label.water_temp_c,
-                label.confidence,
-                label.source,
-                label.notes,
-            )
-            for label in labels
-        ]
-        self._conn.executemany(
+    def insert_labels(self, rows: Iterable[tuple]) -> int:
+        """Insert label parameter tuples (run_id first) and return the count.
+
+        Accepts any iterable, including generators; rows stream straight into
+        executemany without intermediate materialization.
+        """
+        _begin_immediate(self._conn)
+        cursor = self._conn.executemany(
             """
             INSERT INTO labels (
                 run_id,
@@ -121,6 +154,7 @@ class LabelRepository:
             """,
             rows,
         )
+        return cursor.rowcount
 
 
 class RunRegistryRepository:
@@ -128,24 +162,10 @@ class RunRegistryRepository:
         self._conn = conn
 
     def upsert_entries(self, entries: Iterable[RunRegistryEntry]) -> int:
-        rows = [
-            (
-                entry.external_run_id,
-                entry.status,
-                entry.planned_or_recorded_ts,
-                entry.test_device,
-                entry.sensor_cap,
-                entry.diaper_type,
-                entry.test_protocol,
-                entry.findings_comments,
-                entry.test_result_ref,
-                entry.log_file_ref,
-                entry.source_file,
-                entry.source_row_number,
-            )
-            for entry in entries
-        ]
-        self._conn.executemany(
+        # map + attrgetter keeps the whole row pipeline in C: no generator
+        # frame, one call per entry returning the parameter tuple.
+        _begin_immediate(self._conn)
+        cursor = self._conn.executemany(
             """
             INSERT INTO run_registry (
                 external_run_id,
@@ -174,22 +194,52 @@ class RunRegistryRepository:
                 source_file = excluded.source_file,
                 source_row_number = excluded.source_row_number
             """,
-            rows,
+            map(_REGISTRY_COLS, entries),
         )
-        return len(rows)
+        return cursor.rowcount
+
+    def find_many_by_log_file_ref(self, log_file_names: list[str]) -> dict[str, sqlite3.Row]:
+        """Fetch registry rows for several log file names in one query.
+
+        log_file_ref is stored trimmed (the import cleans every value), so
+        the lookups are plain equality probes served by the index from
+        migration 0003 — no TRIM() wrapper that would force a scan.
+        """
+        if not log_file_names:
+            return {}
+        placeholders = ", ".join("?" for _ in log_file_names)
+        rows = self._conn.execute(
+            f"""
+            SELECT *
+            FROM run_registry
+            WHERE log_file_ref IN ({placeholders})
+            """,
+            log_file_names,
+        ).fetchall()
+        return {str(row["log_file_ref"]): row for row in rows}
 
     def find_by_log_file_ref(self, log_file_name: str) -> sqlite3.Row | None:
         return self._conn.execute(
             """
             SELECT *
             FROM run_registry
-            WHERE TRIM(log_file_ref) = ?
+            WHERE log_file_ref = ?
             """,
             (log_file_name,),
         ).fetchone()
 
-    def attach_run(self, registry_id: int, run_id: int) -> None:
-        self._conn.execute(
-            "UPDATE run_registry SET run_id = ? WHERE registry_id = ?;",
-            (run_id, registry_id),
-        )
+    def attach_by_log_file(self, run_id: int, log_file_name: str) -> int | None:
+        """Link a run to the unlinked registry row referencing its log file.
+
+        Search and attach are a single UPDATE ... RETURNING statement, served
+        by the unique index on log_file_ref (values are stored trimmed, so no
+        TRIM() is needed to match). Only a row without a run_id is linked, so
+        an already-attached row is never silently relinked. Returns the
+        registry_id, or None when no unlinked row references the file.
+        """
+        row = self._conn.execute(
+            "UPDATE run_registry SET run_id = ? "
+            "WHERE log_file_ref = ? AND run_id IS NULL RETURNING registry_id;",
+            (run_id, log_file_name),
+        ).fetchone()
+        return int(row["registry_id"]) if row is not None else None
@@ -60,6 +60,36 @@ def test_ingest_basic(initialized_db: pathlib.Path, repo_root: pathlib.Path, tmp
         assert readings["n"] == 3
 
 
+def test_ingest_csv_stdlib_fallback(
+    initialized_db: pathlib.Path,
+    repo_root: pathlib.Path,
+    tmp_path: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The stdlib CSV parser must yield the same rows as the pandas fast path."""
+    from luna_tb.services import ingest as ingest_module
+
+    monkeypatch.setattr(ingest_module, "_pandas", lambda: None)
+
+    log_path = repo_root / "tests" / "data" / "log_basic.csv"
+    _import_registry_for_log(initialized_db, tmp_path, run_id="T10003", log_file_name=log_path.name)
+
+    run_ids = ingest_logs(
+        initialized_db,
+        [log_path],
+        device_id="LUNA-001",
+        diaper_type="infant",
+        sensor_layout="front",
+    )
+
+    with get_connection(initialized_db) as conn:
+        readings = conn.execute(
+            "SELECT COUNT(*) AS n FROM readings WHERE run_id = ?",
+            (run_ids[0],),
+        ).fetchone()
+        assert readings["n"] == 3
+
+
 def test_ingest_missing_registry_entry_raises(
     initialized_db: pathlib.Path,
     repo_root: pathlib.Path,
@@ -76,6 +106,33 @@ def test_ingest_missing_registry_entry_raises(
         )
 
 
+def test_ingest_duplicate_log_file_in_batch_raises(
+    initialized_db: pathlib.Path,
+    repo_root: pathlib.Path,
+    tmp_path: pathlib.Path,
+) -> None:
+    log_path = repo_root / "tests" / "data" / "log_basic.csv"
+    _import_registry_for_log(initialized_db, tmp_path, run_id="T10004", log_file_name=log_path.name)
+
+    with pytest.raises(IngestError, match="already linked"):
+        ingest_logs(
+            initialized_db,
+            [log_path, log_path],
+            device_id="LUNA-001",
+            diaper_type="infant",
+            sensor_layout="front",
+        )
+
+    # The failed batch must roll back entirely: no runs and no link.
+    with get_connection(initialized_db) as conn:
+        assert conn.execute("SELECT COUNT(*) AS n FROM runs").fetchone()["n"] == 0
+        linked = conn.execute(
+            "SELECT run_id FROM run_registry WHERE external_run_id = ?",
+            ("T10004",),
+        ).fetchone()
+        assert linked["run_id"] is None
+
+
 def test_ingest_missing_columns(initialized_db: pathlib.Path, tmp_path: pathlib.Path) -> None:
     bad_csv = tmp_path / "bad.csv"
     bad_csv.write_text("t_elapsed_s,temp_c\n0,25.0\n", encoding="utf-8")
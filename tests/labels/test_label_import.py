@@ -36,6 +36,46 @@ def test_label_import_basic(initialized_db: pathlib.Path, repo_root: pathlib.Pat
         assert labels["n"] == 2
 
 
+def test_label_import_stdlib_fallback(
+    initialized_db: pathlib.Path,
+    repo_root: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The stdlib label parser must yield the same rows as the pandas fast path."""
+    from luna_tb.services import label_import as label_module
+
+    monkeypatch.setattr(label_module, "_pandas", lambda: None)
+
+    labels_path = repo_root / "tests" / "data" / "labels_basic.csv"
+
+    with get_connection(initialized_db) as conn:
+        run_id = RunRepository(conn).create_run(
+            RunMetadata(
+                device_id="LUNA-001",
+                diaper_type="infant",
+                sensor_layout="front",
+            )
+        )
+        conn.commit()
+
+    count = import_labels_csv(initialized_db, labels_path, run_id=run_id)
+    assert count == 2
+
+
+def test_label_import_rejects_fractional_run_id(
+    initialized_db: pathlib.Path, tmp_path: pathlib.Path
+) -> None:
+    for bad_value in ("2.5", "5.0"):
+        bad_labels = tmp_path / f"labels_{bad_value}.csv"
+        bad_labels.write_text(
+            f"run_id,event_type,event_time_s\n{bad_value},ADDITION,1.0\n",
+            encoding="utf-8",
+        )
+
+        with pytest.raises(LabelImportError, match="Invalid run_id"):
+            import_labels_csv(initialized_db, bad_labels)
+
+
 def test_label_import_requires_run_id(initialized_db: pathlib.Path, tmp_path: pathlib.Path) -> None:
     bad_labels = tmp_path / "labels.csv"
     bad_labels.write_text("event_type,event_time_s\nADDITION,1.0\n", encoding="utf-8")
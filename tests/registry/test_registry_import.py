@@ -4,7 +4,11 @@ import pathlib
 
 import pytest
 
-from luna_tb.services.registry_import import RegistryImportError, import_run_registry
+from luna_tb.services.registry_import import (
+    RegistryImportError,
+    import_run_registries,
+    import_run_registry,
+)
 from luna_tb.storage.db import get_connection
 
 pytestmark = pytest.mark.registry
@@ -45,6 +49,61 @@ def test_registry_import_xlsx(initialized_db: pathlib.Path, repo_root: pathlib.P
     assert row["log_file_ref"] == "2026-02-03 13-37-48.log"
 
 
+def test_registry_import_xlsx_xml_fallback(
+    initialized_db: pathlib.Path,
+    repo_root: pathlib.Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The XML reader must yield the same entries as the calamine fast path."""
+    from luna_tb.services import registry_import as registry_module
+
+    monkeypatch.setattr(registry_module, "_calamine", lambda: None)
+
+    xlsx_path = repo_root / "data" / "reference" / "LUNAdevice_testResults.xlsx"
+
+    imported = import_run_registry(initialized_db, xlsx_path, sheet_name="test runs")
+    assert imported > 0
+
+    with get_connection(initialized_db) as conn:
+        row = conn.execute(
+            "SELECT external_run_id, status, log_file_ref FROM run_registry WHERE external_run_id = ?",
+            ("T00007",),
+        ).fetchone()
+
+    assert row is not None
+    assert row["status"] == "Done"
+    assert row["log_file_ref"] == "2026-02-03 13-37-48.log"
+
+
+def test_registry_import_multiple_files(
+    initialized_db: pathlib.Path, tmp_path: pathlib.Path
+) -> None:
+    header = "RunID,test status,timestamp,log file\n"
+    first = tmp_path / "registry_a.csv"
+    first.write_text(
+        header + "T30001,Done,2026-03-01 10:00:00,2026-03-01 10-00-00.log\n",
+        encoding="utf-8",
+    )
+    second = tmp_path / "registry_b.csv"
+    second.write_text(
+        header + "T30002,Done,2026-03-02 10:00:00,2026-03-02 10-00-00.log\n",
+        encoding="utf-8",
+    )
+
+    imported = import_run_registries(initialized_db, [first, second])
+    assert imported == 2
+
+    with get_connection(initialized_db) as conn:
+        rows = conn.execute(
+            "SELECT external_run_id, source_file FROM run_registry ORDER BY external_run_id"
+        ).fetchall()
+
+    assert [(row["external_run_id"], row["source_file"]) for row in rows] == [
+        ("T30001", "registry_a.csv"),
+        ("T30002", "registry_b.csv"),
+    ]
+
+
 def test_registry_import_requires_runid(initialized_db: pathlib.Path, tmp_path: pathlib.Path) -> None:
     bad_csv = tmp_path / "bad_registry.csv"
     bad_csv.write_text("test status,log file\nDone,sample.log\n", encoding="utf-8")